@@ -1,18 +1,81 @@
-import json
 from math import e
 from app.api.schemas import UserProgram
-from fastapi import APIRouter, Depends
+from app.api.services import ensure_problems_fresh, make_etag
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import ORJSONResponse
 
-from app.utils.security import decode_token, get_current_user
+from app.core.cache import cache, submission_cache
+from app.utils.security import UserDep
+from logs.logging import logger
 import httpx
-from app.core.config import settings
+import orjson
 
 
 router = APIRouter()
 
+# Judge0 paths, relative to the shared client's base_url
+SUBMIT_URL = "/submissions?base64_encoded=false&wait=true"
+SUBMISSIONS_URL = "/submissions?base64_encoded=false"
+SYSTEM_INFO_URL = "/system_info"
+STATISTICS_URL = "/statistics"
+LANGUAGES_URL = "/languages"
+
+HEADERS = {
+    "Content-Type": "application/json",
+    # Add your RapidAPI key if required:
+    # "X-RapidAPI-Key": "<YOUR_RAPIDAPI_KEY>",
+    # "X-RapidAPI-Host": "judge0-ce.p.rapidapi.com"
+}
+
+# Cache lifetimes (seconds) for idempotent Judge0 reads
+LANGUAGES_TTL = 3600
+SYSTEM_INFO_TTL = 60
+STATISTICS_TTL = 5
+# /submit only evicts its own worker's cache; this bounds how stale other workers can be
+SUBMISSIONS_TTL = 5
+SUBMISSION_TTL = 86400
+
+# Browser cache lifetime (seconds) for /problems
+PROBLEMS_MAX_AGE = 300
+
+# Judge0 status ids >= 3 are final (Accepted, Wrong Answer, errors, ...)
+FINAL_STATUS_ID = 3
+
+
+async def get_judge0(request: Request) -> httpx.AsyncClient:
+    """
+    Dependency that returns the shared Judge0 client created in the app lifespan.
+    """
+    return request.app.state.judge0
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Weak comparison of an If-None-Match header (tag list, W/ tags or "*") against an ETag.
+    """
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+def etag_response(request: Request, content: bytes, etag: str, max_age: int) -> Response:
+    """
+    Return 304 when the client already holds this body, otherwise the body with its ETag.
+    """
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+    if etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
 
 @router.get("/")
-async def check(token = Depends(get_current_user)):
+async def check(token: UserDep):
     """
     Root endpoint that returns a simple message.
     """
@@ -20,36 +83,28 @@ async def check(token = Depends(get_current_user)):
 
 
 @router.get("/problems")
-async def get_problems():
+async def get_problems(request: Request):
     """
     Endpoint to get problems.
     """
-    try:
-        with open("problems.json") as f:
-            problems = json.load(f)
-        return problems
-
-    except Exception as e:
-        raise e
+    state = request.app.state
+    await ensure_problems_fresh(state)
+    return etag_response(request, state.problems_blob, state.problems_etag, PROBLEMS_MAX_AGE)
 
 @router.get("/problems/{problem_id}")
-async def get_problem(problem_id: int):
+async def get_problem(problem_id: int, request: Request):
     """
     Endpoint to get a specific problem by ID.
     """
-    try:
-        with open("problems.json") as f:
-            problems = json.load(f)
-        problem = next((p for p in problems if p["id"] == problem_id), None)
-        if not problem:
-            return {"error": "Problem not found"}
-        return problem
-
-    except Exception as e:
-        raise e
+    state = request.app.state
+    await ensure_problems_fresh(state)
+    problem = state.problems_by_id_blob.get(problem_id)
+    if not problem:
+        return {"error": "Problem not found"}
+    return Response(content=problem, media_type="application/json")
 
 @router.post("/submit")
-async def submit_code(code: UserProgram):
+async def submit_code(code: UserProgram, client: httpx.AsyncClient = Depends(get_judge0)):
     """
     Endpoint to submit code for execution.
     """
@@ -60,136 +115,106 @@ async def submit_code(code: UserProgram):
             "command_line_arguments": code.command_line_arguments,
         }
 
-        print(data)
+        logger.opt(lazy=True).debug("submit language_id={} source_size={}",
+                                    lambda: code.language_id, lambda: len(code.source_code))
 
-        JUDGE0_API_URL = f"{settings.code_arena_api_url}/submissions?base64_encoded=false&wait=true"
-        HEADERS = {
-            "Content-Type": "application/json",
-            # Add your RapidAPI key if required:
-            # "X-RapidAPI-Key": "<YOUR_RAPIDAPI_KEY>",
-            # "X-RapidAPI-Host": "judge0-ce.p.rapidapi.com"
-        }
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(JUDGE0_API_URL, headers=HEADERS, json=data)
-            response.raise_for_status()
-            print(response.json())
-            result = response.json()
-        return result
+        response = await client.post(SUBMIT_URL, headers=HEADERS, json=data)
+        response.raise_for_status()
+        await cache.invalidate_tag("submissions")
+        logger.debug("judge0 {} -> {}", SUBMIT_URL, response.status_code)
+        result = orjson.loads(response.content)
+        return ORJSONResponse(result)
     except Exception as e:
         raise e
 
 @router.get("/submissions")
-async def get_submissions():
+async def get_submissions(client: httpx.AsyncClient = Depends(get_judge0)):
     """
     Endpoint to get all submissions.
     """
     try:
-        JUDGE0_API_URL = f"{settings.code_arena_api_url}/submissions?base64_encoded=false"
-        HEADERS = {
-            "Content-Type": "application/json",
-            # Add your RapidAPI key if required:
-            # "X-RapidAPI-Key": "<YOUR_RAPIDAPI_KEY>",
-            # "X-RapidAPI-Host": "judge0-ce.p.rapidapi.com"
-        }
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(JUDGE0_API_URL, headers=HEADERS)
+        async def fetch():
+            response = await client.get(SUBMISSIONS_URL, headers=HEADERS)
             response.raise_for_status()
-            print(response.json())
-            result = response.json()
-        return result
+            logger.debug("judge0 {} -> {}", SUBMISSIONS_URL, response.status_code)
+            return response.content
+
+        content = await cache.get_or_set(SUBMISSIONS_URL, fetch, ttl=SUBMISSIONS_TTL, tags={"submissions"})
+        return Response(content=content, media_type="application/json")
     except Exception as e:
         raise e
 
 @router.get("/submit/{submission_id}")
-async def get_submission(submission_id: str):
+async def get_submission(submission_id: str, client: httpx.AsyncClient = Depends(get_judge0)):
     """
     Endpoint to get the result of a submission by ID.
     """
     try:
-        JUDGE0_API_URL = f"{settings.code_arena_api_url}/submissions/{submission_id}?base64_encoded=false"
-        HEADERS = {
-            "Content-Type": "application/json",
-            # Add your RapidAPI key if required:
-            # "X-RapidAPI-Key": "<YOUR_RAPIDAPI_KEY>",
-            # "X-RapidAPI-Host": "judge0-ce.p.rapidapi.com"
-        }
-
-        async with httpx.AsyncClient() as client:
+        JUDGE0_API_URL = f"/submissions/{submission_id}?base64_encoded=false"
+        content = await submission_cache.get(JUDGE0_API_URL)
+        if content is None:
             response = await client.get(JUDGE0_API_URL, headers=HEADERS)
             response.raise_for_status()
-            print(response.json())
-            result = response.json()
-        return result
+            logger.debug("judge0 {} -> {}", JUDGE0_API_URL, response.status_code)
+            content = response.content
+            # Only finished submissions are cached; queued/processing ones still change
+            status = orjson.loads(content).get("status") or {}
+            if status.get("id", 0) >= FINAL_STATUS_ID:
+                await submission_cache.set(JUDGE0_API_URL, content, ttl=SUBMISSION_TTL)
+        return Response(content=content, media_type="application/json")
     except Exception as e:
         raise e
 
 @router.get("/system_info")
-async def get_system_info():
+async def get_system_info(request: Request, client: httpx.AsyncClient = Depends(get_judge0)):
     """
     Endpoint to get system information.
     """
     try:
-        JUDGE0_API_URL = f"{settings.code_arena_api_url}/system_info"
-        HEADERS = {
-            "Content-Type": "application/json",
-            # Add your RapidAPI key if required:
-            # "X-RapidAPI-Key": "<YOUR_RAPIDAPI_KEY>",
-            # "X-RapidAPI-Host": "judge0-ce.p.rapidapi.com"
-        }
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(JUDGE0_API_URL, headers=HEADERS)
+        # Upstream bytes are cached and returned as-is, with no JSON decode/encode
+        cached = await cache.get(SYSTEM_INFO_URL)
+        if cached is None:
+            response = await client.get(SYSTEM_INFO_URL, headers=HEADERS)
             response.raise_for_status()
-            print(response.json())
-            result = response.json()
-        return result
+            logger.debug("judge0 {} -> {}", SYSTEM_INFO_URL, response.status_code)
+            cached = (response.content, make_etag(response.content))
+            await cache.set(SYSTEM_INFO_URL, cached, ttl=SYSTEM_INFO_TTL)
+        content, etag = cached
+        return etag_response(request, content, etag, SYSTEM_INFO_TTL)
     except Exception as e:
         raise e
 
 @router.get("/statistics")
-async def get_statistics():
+async def get_statistics(client: httpx.AsyncClient = Depends(get_judge0)):
     """
     Endpoint to get statistics.
     """
     try:
-        JUDGE0_API_URL = f"{settings.code_arena_api_url}/statistics"
-        HEADERS = {
-            "Content-Type": "application/json",
-            # Add your RapidAPI key if required:
-            # "X-RapidAPI-Key": "<YOUR_RAPIDAPI_KEY>",
-            # "X-RapidAPI-Host": "judge0-ce.p.rapidapi.com"
-        }
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(JUDGE0_API_URL, headers=HEADERS)
+        async def fetch():
+            response = await client.get(STATISTICS_URL, headers=HEADERS)
             response.raise_for_status()
-            print(response.json())
-            result = response.json()
-        return result
+            logger.debug("judge0 {} -> {}", STATISTICS_URL, response.status_code)
+            return response.content
+
+        content = await cache.get_or_set(STATISTICS_URL, fetch, ttl=STATISTICS_TTL, tags={"submissions"})
+        return Response(content=content, media_type="application/json")
     except Exception as e:
         raise e
 
 @router.get("/languages")
-async def get_languages():
+async def get_languages(request: Request, client: httpx.AsyncClient = Depends(get_judge0)):
     """
     Endpoint to get all programming languages.
     """
     try:
-        JUDGE0_API_URL = f"{settings.code_arena_api_url}/languages"
-        HEADERS = {
-            "Content-Type": "application/json",
-            # Add your RapidAPI key if required:
-            # "X-RapidAPI-Key": "<YOUR_RAPIDAPI_KEY>",
-            # "X-RapidAPI-Host": "judge0-ce.p.rapidapi.com"
-        }
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(JUDGE0_API_URL, headers=HEADERS)
+        cached = await cache.get(LANGUAGES_URL)
+        if cached is None:
+            response = await client.get(LANGUAGES_URL, headers=HEADERS)
             response.raise_for_status()
-            print(response.json())
-            result = response.json()
-        return result
+            logger.debug("judge0 {} -> {}", LANGUAGES_URL, response.status_code)
+            cached = (response.content, make_etag(response.content))
+            await cache.set(LANGUAGES_URL, cached, ttl=LANGUAGES_TTL)
+        content, etag = cached
+        return etag_response(request, content, etag, LANGUAGES_TTL)
     except Exception as e:
         raise e
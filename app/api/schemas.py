@@ -1,7 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class UserProgram(BaseModel):
+    model_config = ConfigDict(frozen=True, str_max_length=1_000_000)
+
     source_code : str
     language_id : int
     command_line_arguments: str
@@ -0,0 +1,69 @@
+import asyncio
+import hashlib
+import os
+import time
+
+import orjson
+
+from logs.logging import logger
+
+PROBLEMS_FILE = "problems.json"
+# Seconds between checks of problems.json for changes, per worker
+PROBLEMS_CHECK_INTERVAL = 30
+
+# Ensures a worker runs only one check/reload at a time
+_problems_reload_lock = asyncio.Lock()
+
+
+def make_etag(content: bytes) -> str:
+    """
+    Strong ETag for a response body.
+    """
+    return f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+def read_problems():
+    """
+    Read and parse problems.json along with its mtime. Blocking, so it is run in a worker thread.
+    """
+    # Taken before the read, so a write racing with it triggers another reload
+    mtime = os.path.getmtime(PROBLEMS_FILE)
+    with open(PROBLEMS_FILE, "rb") as f:
+        return mtime, orjson.loads(f.read())
+
+
+async def load_problems(state):
+    """
+    Load problems.json once and keep its serialized bodies on the app state, with an id index.
+    """
+    mtime, problems = await asyncio.to_thread(read_problems)
+
+    # Pre-serialized bodies so the endpoints skip JSON encoding per request
+    state.problems_blob = orjson.dumps(problems)
+    state.problems_by_id_blob = {p["id"]: orjson.dumps(p) for p in problems}
+    state.problems_etag = make_etag(state.problems_blob)
+    state.problems_mtime = mtime
+    state.problems_next_check = time.monotonic() + PROBLEMS_CHECK_INTERVAL
+    return len(problems)
+
+
+async def ensure_problems_fresh(state):
+    """
+    Reload problems.json if it changed on disk since this worker last loaded it.
+
+    The file is stat'ed at most once per PROBLEMS_CHECK_INTERVAL, off the event loop,
+    and only one reload runs at a time. If the file is missing or unreadable, the
+    last good copy keeps being served until the next check.
+    """
+    if time.monotonic() < state.problems_next_check or _problems_reload_lock.locked():
+        return
+
+    async with _problems_reload_lock:
+        state.problems_next_check = time.monotonic() + PROBLEMS_CHECK_INTERVAL
+        try:
+            mtime = await asyncio.to_thread(os.path.getmtime, PROBLEMS_FILE)
+            if mtime != state.problems_mtime:
+                count = await load_problems(state)
+                logger.info(f'[*] Reloaded {count} problems from {PROBLEMS_FILE}')
+        except Exception as e:
+            logger.error(f"Failed to reload {PROBLEMS_FILE}, keeping the last good copy: {e}")
@@ -2,11 +2,9 @@ import uuid
 from typing import Optional
 
 from sqlalchemy import UUID, DateTime, func
-from sqlalchemy.ext.declarative import as_declarative, declarative_base
+from sqlalchemy.ext.declarative import as_declarative
 from sqlalchemy.orm import Mapped, mapped_column
 
-Base = declarative_base()
-
 
 @as_declarative()
 class Base:
@@ -0,0 +1,89 @@
+import time
+
+
+class TTLCache:
+    """
+    Small in-process cache with a per-key expiry, used for idempotent Judge0 GETs.
+    Oldest entries are evicted first once `max_size` entries, or `max_bytes` of
+    bytes values (when set), is reached.
+    """
+
+    def __init__(self, max_size: int = 10_000, max_bytes: int = None):
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self._store = {}
+        self._bytes = 0
+
+    async def get(self, key):
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        value, expires_at, _ = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._evict(key)
+            return None
+        return value
+
+    async def set(self, key, value, ttl=None):
+        size = len(value) if isinstance(value, (bytes, bytearray)) else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        self._evict(key)
+        while self._store and (
+            len(self._store) >= self.max_size
+            or (self.max_bytes is not None and self._bytes + size > self.max_bytes)
+        ):
+            self._evict(next(iter(self._store)))
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._store[key] = (value, expires_at, size)
+        self._bytes += size
+
+    async def delete(self, key):
+        self._evict(key)
+
+    def _evict(self, key):
+        entry = self._store.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+
+class TaggedCache(TTLCache):
+    """
+    TTLCache whose keys can be grouped under tags, so a write can evict
+    every cached read it affects in one call.
+
+    Invalidation is per process: with several uvicorn workers, a write
+    handled by one worker does not evict entries held by the others, so
+    tagged entries still need a TTL to bound cross-worker staleness.
+    """
+
+    def __init__(self, max_size: int = 10_000):
+        super().__init__(max_size)
+        self._tags = {}
+        # Bumped on every invalidation so fetches that started earlier are not stored
+        self._generations = {}
+
+    async def set(self, key, value, ttl=None, tags=()):
+        await super().set(key, value, ttl)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+    async def get_or_set(self, key, fetch, ttl=None, tags=()):
+        value = await self.get(key)
+        if value is None:
+            started = {tag: self._generations.get(tag, 0) for tag in tags}
+            value = await fetch()
+            if all(self._generations.get(tag, 0) == gen for tag, gen in started.items()):
+                await self.set(key, value, ttl, tags)
+        return value
+
+    async def invalidate_tag(self, tag):
+        self._generations[tag] = self._generations.get(tag, 0) + 1
+        for key in self._tags.pop(tag, ()):
+            await self.delete(key)
+
+
+cache = TaggedCache()
+# Finished submission results can carry up to ~1 MB of output each, so they get
+# their own store with a small entry cap and a total byte budget per worker
+submission_cache = TTLCache(max_size=1_000, max_bytes=32 * 1024 * 1024)
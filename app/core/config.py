@@ -1,6 +1,10 @@
-from pydantic_settings import BaseSettings
+from typing import Optional
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", frozen=True)
+
     app_name: str
     app_version: str
     base_path: str
@@ -14,8 +18,11 @@ class Settings(BaseSettings):
     postgresql_database_slave_url: str
 
     environment: str
-
-    class Config:
-        env_file = ".env"
+    # Production uvicorn workers; defaults to os.cpu_count(). Each worker opens up to
+    # 30 connections per database (pool_size 10 + max_overflow 20), so keep
+    # workers * 30 within Postgres max_connections.
+    workers: Optional[int] = None
+    # Bytes buffered by the main log file sink before a write; 1 = line buffering
+    log_buffer_size: int = 8192
 
 settings = Settings()
\ No newline at end of file
@@ -2,7 +2,6 @@ from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from typing import AsyncGenerator
-from sqlalchemy_utils import create_database, database_exists
 
 
 create_db_url = settings.postgresql_database_master_url.replace("+asyncpg", "")
@@ -12,20 +11,35 @@ def create_engine(url, **kwargs):
     return create_async_engine(url, echo=False, **kwargs)
 
 def create_database_if_not_exists():
+    """
+    Create the master database if it does not exist yet.
+
+    Blocking: uses synchronous psycopg2 connections, so call it from a worker
+    thread (e.g. asyncio.to_thread) when running inside the event loop.
+    """
+    # Imported lazily: sqlalchemy_utils pulls in psycopg2, which is only needed here
+    from sqlalchemy_utils import create_database, database_exists
+
     if not database_exists(create_db_url):
         create_database(create_db_url)
         return True
     return False
 
 
-# ✅ Add `expire_on_commit=False` to prevent session expiration
-master_db_engine = create_engine(settings.postgresql_database_master_url)
-slave_db_engine = create_engine(
-    settings.postgresql_database_slave_url,
-    pool_size=10, max_overflow=20, pool_recycle=3600, pool_timeout=30, pool_pre_ping=True
+# Shared pool tuning; larger asyncpg statement caches keep prepared statements reused
+POOL_OPTIONS = dict(
+    pool_size=10, max_overflow=20, pool_recycle=3600, pool_timeout=30, pool_pre_ping=True,
+    connect_args={
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 256,
+        "server_settings": {"jit": "off"},
+    },
 )
 
-# ✅ Add `expire_on_commit=False`
+master_db_engine = create_engine(settings.postgresql_database_master_url, **POOL_OPTIONS)
+slave_db_engine = create_engine(settings.postgresql_database_slave_url, **POOL_OPTIONS)
+
+# ✅ Add `expire_on_commit=False` to prevent session expiration
 async_master_session = async_sessionmaker(
     bind=master_db_engine, autocommit=False, autoflush=False, expire_on_commit=False
 )
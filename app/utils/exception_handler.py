@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import re
 from json import JSONDecodeError
 
@@ -14,6 +15,15 @@ from logs.logging import logger
 from main import app
 from app.core.config import settings
 
+# Fallback pattern for "Key (field)=(value)" in unique-violation messages
+KEY_VALUE_PATTERN = re.compile(r'Key \((?P<field>[^)]+)\)=\((?P<value>[^)]+)\)')
+
+
+@functools.lru_cache(maxsize=128)
+def column_value_pattern(col: str):
+    """Compiled "(col)=(value)" pattern for a column, cached per column name."""
+    return re.compile(rf'\({re.escape(col)}\)=\((?P<val>[^\)]+)\)')
+
 
 def json_response_with_cors(content, status_code):
     return JSONResponse(
@@ -42,22 +52,6 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         content={"detail": "Invalid request format", "errors": exc.errors()}
     )
 
-'''
-=====================================================
-# HTTP Exception Handler
-=====================================================
-'''
-
-
-@app.exception_handler(HTTPException)
-async def http_exception_handler(request: Request, exc: HTTPException):
-    logger.error(
-        f"HTTP Exception {exc.status_code}: {exc.detail} - {request.url}")
-    return json_response_with_cors(
-        status_code=exc.status_code,
-        content={"detail": exc.detail}
-    )
-
 '''
 =====================================================
 # Database Exception Handlers
@@ -104,7 +98,7 @@ async def integrity_error_handler(request: Request, exc: IntegrityError):
         # psycopg2 doesn't expose column_value by default; parse DETAIL if present
         detail = getattr(orig, 'pgerror', '') or str(orig)
         # Try to extract the exact value from the DETAIL clause
-        m = re.search(rf'\({col}\)=\((?P<val>[^\)]+)\)', detail)
+        m = column_value_pattern(col).search(detail)
         val = m.group('val') if m else None
 
         if val:
@@ -114,8 +108,7 @@ async def integrity_error_handler(request: Request, exc: IntegrityError):
 
     else:
         # 2) Fallback regex on generic exception text
-        m = re.search(
-            r'Key \((?P<field>[^)]+)\)=\((?P<value>[^)]+)\)', str(orig))
+        m = KEY_VALUE_PATTERN.search(str(orig))
         if m:
             field = m.group('field')
             value = m.group('value')
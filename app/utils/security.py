@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta, timezone
 import os
-from typing import Optional
+from typing import Annotated, Optional
 from fastapi import Depends
 from fastapi.security import HTTPBearer
 from jose import jwt
@@ -15,6 +15,7 @@ from cryptography.hazmat.backends import default_backend
 SECRET_KEY = settings.secret_key
 ALGORITHM = settings.algorithm
 TOKEN_EXPIRE_MINUTES = settings.access_token_expire_minutes
+DECODE_ALGORITHMS = [ALGORITHM]
 
 
 '''
@@ -40,7 +41,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
 =====================================================
 '''
 def decode_token(token: str):
-    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    payload = jwt.decode(token, SECRET_KEY, algorithms=DECODE_ALGORITHMS)
     # exp = payload.get("exp")
     # if exp and datetime.fromtimestamp(exp, timezone.utc) < datetime.now(timezone.utc):
     #     raise ValueError("Token has expired")
@@ -117,4 +118,8 @@ async def get_current_user(token: HTTPBearer = Depends(HTTPBearer())):
         payload = decode_token(token.credentials)
         return payload.get("id")
     except Exception as e:
-        raise ValueError("Invalid token") from e
\ No newline at end of file
+        raise ValueError("Invalid token") from e
+
+
+# Resolved once per request and shared by every dependant that references it
+UserDep = Annotated[str, Depends(get_current_user)]
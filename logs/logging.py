@@ -1,8 +1,11 @@
 import logging, os, sys
 from loguru import logger
 
+from app.core.config import settings
+
 LOG_DIR  = "logs"
 LOG_FILE = os.path.join(LOG_DIR, "code_arena.log")
+ERROR_LOG_FILE = os.path.join(LOG_DIR, "code_arena.error.log")
 os.makedirs(LOG_DIR, exist_ok=True)
 
 # 1) Remove default sink
@@ -20,12 +23,31 @@ logger.add(
     LOG_FILE,
     level="INFO",
     format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level}</level> | <cyan>{message}</cyan>",
-    rotation="10 MB",
+    rotation="100 MB",
     retention="7 days",
     compression="zip",
     enqueue=True,
-    backtrace=True,
-    diagnose=True,
+    backtrace=False,
+    # Variable introspection on tracebacks is costly; keep it out of production
+    diagnose=settings.environment != "production",
+    # Batch writes instead of flushing every line. Lines only reach the file once
+    # log_buffer_size bytes pile up (or at clean shutdown), so on a quiet service
+    # recent lines can lag indefinitely and are lost if the process is killed.
+    # Set LOG_BUFFER_SIZE=1 for line buffering.
+    buffering=settings.log_buffer_size,
+)
+
+# 3b) Error sink: no queue and line buffering, so each error line is written to the
+# OS as it is logged. It survives the worker being killed, not a host crash.
+logger.add(
+    ERROR_LOG_FILE,
+    level="ERROR",
+    format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level}</level> | <cyan>{message}</cyan>",
+    rotation="100 MB",
+    retention="7 days",
+    compression="zip",
+    backtrace=False,
+    diagnose=settings.environment != "production",
 )
 
 # 4) Intercept stdlib logging
@@ -1,12 +1,15 @@
 import asyncio
+import os
 
+import httpx
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.concurrency import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 
 from app.api.routers import router
+from app.api.services import load_problems
 from app.core.config import settings
 from app.core.db import create_database_if_not_exists, master_db_engine
 from app.core.base_model import Base
@@ -17,12 +20,14 @@ ENV = settings.environment
 
 # Disable documentation if in production
 if ENV == "production":
-    app = FastAPI(docs_url=None, redoc_url=None, root_path=settings.base_path)
+    app = FastAPI(docs_url=None, redoc_url=None, root_path=settings.base_path,
+                  default_response_class=ORJSONResponse)
 else:
     app = FastAPI(title=settings.app_name, version=settings.app_version,
                   description="Code_Arena API documentation",
                   swagger_ui_parameters={"persistAuthorization": True},
-                  root_path=settings.base_path
+                  root_path=settings.base_path,
+                  default_response_class=ORJSONResponse
                   )
     
 
@@ -71,7 +76,8 @@ include_router(router)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Ensure the database exists before starting the application
-    if create_database_if_not_exists():
+    # Runs in a worker thread: sqlalchemy_utils opens blocking psycopg2 connections
+    if await asyncio.to_thread(create_database_if_not_exists):
         logger.info('[*] Database created successfully ✅')
     else:
         logger.info('[*] Database already exists')
@@ -79,8 +85,21 @@ async def lifespan(app: FastAPI):
     async with master_db_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
         logger.info('[*] PostgreSQL Database connected successfully.✅')
+
+    count = await load_problems(app.state)
+    logger.info(f'[*] Loaded {count} problems into memory ✅')
+
+    # Shared Judge0 client so proxied requests reuse pooled keep-alive connections
+    app.state.judge0 = httpx.AsyncClient(
+        base_url=settings.code_arena_api_url,
+        http2=True,
+        limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
+        timeout=30.0,
+    )
     yield
 
+    await app.state.judge0.aclose()
+    logger.info('[*] Judge0 client closed successfully.✅')
 
     logger.info('[*] Database disconnected successfully.✅')
 
@@ -92,4 +111,7 @@ if __name__ == "__main__":
     if ENV != "production":
         uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
     else:
-        uvicorn.run("main:app", host="0.0.0.0", port=8000, workers=4)
+        uvicorn.run("main:app", host="0.0.0.0", port=8000,
+                    workers=settings.workers or os.cpu_count() or 1,
+                    loop="uvloop", http="httptools",
+                    log_level="warning", access_log=False)